@@ -1,6 +1,8 @@
 """Async Client façade."""
 from __future__ import annotations
 
+import httpx
+
 from lium.resources.ssh_keys.async_ssh_keys import AsyncSSHKeys
 
 from .config import Config
@@ -66,13 +68,25 @@ class AsyncClient:
         if max_retries is not None:
             object.__setattr__(self._config, "max_retries", max_retries)
 
+        self._auth = ApiKeyAuth(api_key or "")
         self._transport = transport or HttpxAsyncTransport(
             base_url=self._config.base_url,
-            default_headers={},
+            # The API key is a client-level default header, set once here
+            default_headers=self._auth.headers(),
             timeout=self._config.timeout,
             max_retries=self._config.max_retries,
+            limits=httpx.Limits(
+                max_connections=self._config.max_connections,
+                max_keepalive_connections=self._config.max_keepalive_connections,
+                keepalive_expiry=self._config.keepalive_expiry,
+            ),
+            http2=self._config.http2,
+        )
+
+        # Our own transports already send the key; only custom ones need the proxy
+        self._transport_with_auth: Transport = (
+            self._auth.decorate(transport) if transport else self._transport
         )
-        self._auth = ApiKeyAuth(api_key or "")
 
         # -------------- resources -------------- #
         secured = self._transport_with_auth
@@ -81,17 +95,6 @@ class AsyncClient:
         self.templates = AsyncTemplates(secured, self)
         self.ssh_keys = AsyncSSHKeys(secured, self)
         
-    # ------------------------------------------------- #
-    @property
-    def _transport_with_auth(self) -> Transport:
-        """
-        Return a transport instance decorated with authentication.
-
-        :return: Authenticated transport instance.
-        :rtype: Transport
-        """
-        return self._auth.decorate(self._transport)
-
     # ---------------- context mgr ------------------- #
     async def __aenter__(self):  # async context
         """
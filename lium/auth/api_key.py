@@ -12,6 +12,9 @@ class ApiKeyAuth(AuthStrategy):
             raise ValueError("api_key must be non-empty")
         self._api_key = api_key
 
+    def headers(self) -> dict[str, str]:
+        return {self._HEADER: self._api_key}
+
     # ------------------ strategy entry ----------------- #
     def decorate(self, transport: Transport) -> Transport:
         api_key = self._api_key  # close over
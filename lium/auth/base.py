@@ -16,3 +16,7 @@ class AuthStrategy(ABC):
     def decorate(self, transport: Transport) -> Transport:
         """Return a proxy that injects credentials."""
         ...
+
+    def headers(self) -> dict[str, str]:
+        """Static credential headers a transport can send on every request, if any."""
+        return {}
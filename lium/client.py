@@ -1,8 +1,11 @@
 """Sync Client façade."""
 from __future__ import annotations
 
+import httpx
+
 from .config import Config
 from .transport.httpx_sync import HttpxSyncTransport
+from .transport.pool import get_shared_pool
 from .auth.api_key import ApiKeyAuth
 # Add resources here
 from .resources.pods import Pods
@@ -69,13 +72,28 @@ class Client:
             object.__setattr__(self._config, "max_retries", max_retries)
 
         # -------------- core plumbing -------------- #
+        self._auth = ApiKeyAuth(api_key or "")
+        limits = httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
         self._transport = transport or HttpxSyncTransport(
             base_url=self._config.base_url,
-            default_headers={},
+            # The API key is a client-level default header, set once here
+            default_headers=self._auth.headers(),
             timeout=self._config.timeout,
             max_retries=self._config.max_retries,
+            limits=limits,
+            http2=self._config.http2,
+            # Clients in the same process share keep-alive connections
+            transport=get_shared_pool(limits, self._config.http2),
+        )
+
+        # Our own transports already send the key; only custom ones need the proxy
+        self._transport_with_auth: Transport = (
+            self._auth.decorate(transport) if transport else self._transport
         )
-        self._auth = ApiKeyAuth(api_key or "")
 
         # -------------- resources -------------- #
         secured = self._transport_with_auth
@@ -84,19 +102,6 @@ class Client:
         self.templates = Templates(secured, self)
         self.ssh_keys = SSHKeys(secured, self)
         
-    # ============================================== #
-    # Helpers
-    # ============================================== #
-    @property
-    def _transport_with_auth(self) -> Transport:
-        """
-        Return a transport instance decorated with authentication.
-
-        :return: Authenticated transport instance.
-        :rtype: Transport
-        """
-        return self._auth.decorate(self._transport)
-
     # -------------- context mgr -------------- #
     def __enter__(self):  # sync
         """
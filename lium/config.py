@@ -17,4 +17,9 @@ class Config:
     base_url: str = _env("LIUM_BASE_URL", "https://celiumcompute.ai/api")
     timeout: float = float(_env("LIUM_TIMEOUT", "10"))
     max_retries: int = int(_env("LIUM_MAX_RETRIES", "2"))
+    max_connections: int = int(_env("LIUM_MAX_CONNECTIONS", "100"))
+    max_keepalive_connections: int = int(_env("LIUM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    # 15s matches the idle timeout of typical nginx / ALB front-ends.
+    keepalive_expiry: float = float(_env("LIUM_KEEPALIVE_EXPIRY", "15"))
+    http2: bool = _env("LIUM_HTTP2", "1") == "1"
     sdk_version: str = "0.1.0"
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cached_property
 from uuid import UUID
 from . import _FrozenBase
 
@@ -97,6 +98,11 @@ class ExecutorFilterQuery(_FrozenBase):
     lon: float | None = None
     max_distance_mile: float | None = None
 
+    @cached_property
+    def _dumped_json(self) -> dict:
+        """Query params for `/executors`; computed once since the model is frozen."""
+        return self.model_dump(mode='json', exclude_none=True)
+
 
 class _ExecutorBase(_FrozenBase):
     id: UUID
@@ -116,6 +122,23 @@ class ExecutorForPod(_ExecutorBase):
     active: bool
 
 
+class _GpuCount(_FrozenBase):
+    count: int
+
+
+class _SummarySpec(_FrozenBase):
+    gpu: _GpuCount
+
+
+class ExecutorSummary(_FrozenBase):
+    """Projection of `Executor` with only the fields needed to pick and rent one."""
+    id: UUID
+    machine_name: str | None = None
+    price_per_hour: float
+    specs: _SummarySpec
+    uptime_in_minutes: int | None = None
+
+
 class ExecutorStatus(_FrozenBase):
     logs: list[dict]
     
\ No newline at end of file
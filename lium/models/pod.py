@@ -20,6 +20,12 @@ class _PodBase(_FrozenBase):
     created_at: datetime
 
 
+class PodStatus(_FrozenBase):
+    """Just the id and status of a `GET /pods` row."""
+    id: UUID
+    status: Literal["RUNNING", "STOPPED", "FAILED", "PENDING", "DELETING"]
+
+
 class PodList(_PodBase):
     id: UUID
     template: TemplateForPod
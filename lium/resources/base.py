@@ -4,6 +4,7 @@ from typing import Any, TYPE_CHECKING
 
 from ..transport.base import Transport
 from ..exceptions import map_http_error
+from ..utils.serialization import loads
 if TYPE_CHECKING:
     from lium import Client, AsyncClient
 
@@ -12,11 +13,19 @@ class _BaseResource:
     _t: Transport
     
     # ----------------------------------------------- #
-    def _get_json(self, resp) -> Any:
+    def _raise_for_status(self, resp) -> None:
         if resp.status_code // 100 != 2:
             rid = resp.headers.get("x-request-id")
             map_http_error(resp.status_code, resp.text, rid)
-        return resp.json()
+
+    def _get_json(self, resp) -> Any:
+        self._raise_for_status(resp)
+        return loads(resp.content)
+
+    def _get_content(self, resp) -> bytes:
+        """Raw response body, for parsers that validate JSON bytes directly."""
+        self._raise_for_status(resp)
+        return resp.content
     
 
 class BaseResource(_BaseResource):
@@ -1,10 +1,13 @@
+import asyncio
 import uuid
-import time
-from typing import Any
+# Only the clock: waiting must go through asyncio.sleep, never time.sleep
+from time import monotonic
+from typing import Any, Iterable, Literal
 from lium.models.pod import Pod, PodList
+from lium.utils.ttl_cache import ttl_cache, invalidates_ttl_cache
 from lium.resources.base import BaseAsyncResource
-from lium.resources.pods.pods_core import _PodsCore
-from lium.models.executor import Executor, ExecutorFilterQuery
+from lium.resources.pods.pods_core import ExecutorSortKey, _PodsCore
+from lium.models.executor import Executor, ExecutorFilterQuery, ExecutorSummary
 from lium.utils.logging import logger
 
 
@@ -13,19 +16,65 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
     Async pods resource.
     """
     
-    async def list_executors(self, filter_query: ExecutorFilterQuery | dict | None = None) -> list[Executor]:
+    async def list_executors(
+        self,
+        filter_query: ExecutorFilterQuery | dict | None = None,
+        *,
+        sort_by: ExecutorSortKey | None = None,
+        sort_order: Literal["asc", "desc"] | None = None,
+        limit: int | None = None,
+    ) -> list[Executor]:
         """
         List all executors. These are the machines from subnet that aren't being rented out.
 
         :param filter_query: Filter query to filter the executors.
         :type filter_query: ExecutorFilterQuery or dict or None
+        :param sort_by: Sort executors by `price`, `gpu_count` or `uptime` (default).
+        :type sort_by: str or None
+        :param sort_order: `asc` or `desc` (default).
+        :type sort_order: str or None
+        :param limit: Only return the first `limit` executors after sorting.
+        :type limit: int or None
         :return: List of executors.
         :rtype: list[Executor]
         """
         args, kwargs = self._list_executors_params(filter_query)
         resp = await self._t.arequest(*args, **kwargs)
-        return self._parse_list_executors_response(resp.json())
+        return self._parse_sorted_executors(self._get_content(resp), sort_by, sort_order, limit)
+
+    async def list_executor_summaries(
+        self,
+        filter_query: ExecutorFilterQuery | dict | None = None,
+        *,
+        sort_by: ExecutorSortKey | None = None,
+        sort_order: Literal["asc", "desc"] | None = None,
+        limit: int | None = None,
+    ) -> list[ExecutorSummary]:
+        """
+        List executors with only id, machine name, price, GPU count and uptime.
+        Faster to parse than :meth:`list_executors` when picking an executor to rent, since
+        every other field of the listing is skipped instead of validated.
+
+        :param filter_query: Filter query to filter the executors.
+        :type filter_query: ExecutorFilterQuery or dict or None
+        :param sort_by: Sort executors by `price`, `gpu_count` or `uptime` (default).
+        :type sort_by: str or None
+        :param sort_order: `asc` or `desc` (default).
+        :type sort_order: str or None
+        :param limit: Only return the first `limit` executors after sorting.
+        :type limit: int or None
+        :return: List of executor summaries.
+        :rtype: list[ExecutorSummary]
+        """
+        args, kwargs = self._list_executors_params(filter_query)
+        resp = await self._t.arequest(*args, **kwargs)
+        return self._parse_sorted_executors(self._get_content(resp), sort_by, sort_order, limit, summary=True)
+
+    @ttl_cache(seconds=10)
+    async def _list_executor_summaries_cached(self, filter_query: ExecutorFilterQuery | dict | None = None) -> list[ExecutorSummary]:
+        return await self.list_executor_summaries(filter_query)
 
+    @invalidates_ttl_cache
     async def create(
         self, 
         id_in_site: uuid.UUID, 
@@ -54,6 +103,7 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
         })
         return await self.retrieve(id_in_site)
 
+    @invalidates_ttl_cache
     async def delete(self, id_in_site: uuid.UUID) -> None:
         """
         Delete a pod.
@@ -72,7 +122,7 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
         :rtype: list[PodList]
         """
         resp = await self._t.arequest("GET", "/pods")
-        return self._parse_list_pods_response(resp.json())
+        return self._parse_list_pods_response(self._get_json(resp))
     
     async def retrieve(self, id: uuid.UUID, wait_until_running: bool = False, timeout: int = 5 * 60) -> Pod:
         """
@@ -87,27 +137,60 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
         :return: The retrieved pod.
         :rtype: Pod
         """
-        resp = await self._t.arequest("GET", f"/pods/{id}")
-        elapsed_time = 0
-        pod = None
-        while elapsed_time < timeout:
-            resp = await self._t.arequest("GET", f"/pods/{id}")
-            pod = self._parse_pod_response(resp.json())
+        url = f"{self.ENDPOINT}/{id}"  # formatted once, not per poll
+        start = monotonic()
+        delay = self.POLL_INITIAL_DELAY
+        etag = None
+        while True:
+            # Unchanged pods come back as an empty 304, so the cached pod is reused
+            resp = await self._t.arequest("GET", url, headers={"If-None-Match": etag} if etag else None)
+            if resp.status_code != 304:
+                pod = self._parse_pod_response(self._get_json(resp))
+                etag = resp.headers.get("etag")
             if not wait_until_running or pod.status == "RUNNING":
                 return pod
-            time.sleep(5)
-            elapsed_time += 5
-            logger.debug(f"Pod {id} status: {pod.status}, elapsed time: {elapsed_time}s")
-        return pod
+            if monotonic() - start >= timeout:
+                return pod
+            await asyncio.sleep(delay)
+            delay = self._next_poll_delay(delay)
+            logger.debug(f"Pod {id} status: {pod.status}, elapsed time: {monotonic() - start:.0f}s")
     
+    async def wait_until_all_running(self, ids: Iterable[uuid.UUID], timeout: int = 5 * 60) -> dict[uuid.UUID, str]:
+        """
+        Wait until all given pods are running, polling the pod list once per interval.
+
+        :param ids: The ids of the pods.
+        :type ids: Iterable[uuid.UUID]
+        :param timeout: Timeout in seconds to wait for the pods to be running.
+        :type timeout: int, optional
+        :return: Last known status of every pod, keyed by pod id.
+        :rtype: dict[uuid.UUID, str]
+        """
+        pending = {uuid.UUID(str(id)) for id in ids}
+        statuses: dict[uuid.UUID, str] = {}
+        start = monotonic()
+        delay = self.POLL_INITIAL_DELAY
+        while pending:
+            # One pod listing per tick covers every pending pod
+            resp = await self._t.arequest("GET", self.ENDPOINT)
+            self._update_pending(pending, statuses, self._parse_pod_statuses_response(self._get_content(resp)))
+            if not pending or monotonic() - start >= timeout:
+                break
+            await asyncio.sleep(delay)
+            delay = self._next_poll_delay(delay)
+            logger.debug(f"Waiting for {len(pending)} pods, elapsed time: {monotonic() - start:.0f}s")
+        return statuses
+
     async def easy_deploy(
         self,
         machine_query: str,
         docker_image: str | None = None,
         dockerfile: str | None = None,
         template_id: str | None = None,
-        additional_machine_filter: dict[str, Any] = {},
+        additional_machine_filter: dict[str, Any] | None = None,
         pod_name: str | None = None,
+        use_cache: bool = True,
+        pod_name_prefix: str = "lium-pod",
     ) -> None:
         """Easy deploy a pod. 
 
@@ -125,9 +208,14 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
         Will use provided template from the platform to deploy a pod.
         :type template_id: str or None
         :param additional_machine_filter: Additional machine filter to filter the executors.
-        :type additional_machine_filter: dict[str, Any]
+        :type additional_machine_filter: dict[str, Any] or None
         :param pod_name: The name of the pod.
         :type pod_name: str or None
+        :param use_cache: Reuse executors listed for the same filter within the last 10 seconds,
+            and SSH keys and verified templates looked up within the last minute.
+        :type use_cache: bool
+        :param pod_name_prefix: Prefix of the generated name when `pod_name` is not given.
+        :type pod_name_prefix: str
         :return: The created pod.
         :rtype: Pod
         """
@@ -136,35 +224,49 @@ class AsyncPods(BaseAsyncResource, _PodsCore):
         try:
             # Find matching executor first
             machines, count = self._parse_machine_query(machine_query)
-            executors = await self.list_executors(
-                {
-                    "machine_names": machines,
-                    **({"gpu_count_gte": count, "gpu_count_lte": count} if count else {}),
-                    **additional_machine_filter
-                    }
-            )
+            machine_filter: dict[str, Any] = {"machine_names": machines}
+            if count:
+                machine_filter["gpu_count_gte"] = machine_filter["gpu_count_lte"] = count
+            if additional_machine_filter:
+                machine_filter.update(additional_machine_filter)
+            list_executors = self._list_executor_summaries_cached if use_cache else self.list_executor_summaries
+            client = self._client
+            retrieve_template = client.templates._retrieve_cached if use_cache else client.templates.retrieve
+            list_ssh_keys = client.ssh_keys._list_cached if use_cache else client.ssh_keys.list
+
+            # Executors, an existing template and ssh keys are independent reads, so fetch them concurrently
+            lookups = [list_executors(machine_filter), list_ssh_keys()]
+            if template_id:
+                lookups.append(retrieve_template(template_id))
+            executors, ssh_keys, *retrieved = await asyncio.gather(*lookups, return_exceptions=True)
+
+            if isinstance(executors, BaseException):
+                raise executors
             if len(executors) == 0:
                 logger.warning(f"No executors found for machine query: {machine_query}")
                 return
             logger.debug(f"Found {len(executors)} executors for machine query: {machine_query}")
-            
-            if not template_id:
-                # Find the template to deploy 
+
+            if template_id:
+                if isinstance(retrieved[0], BaseException):
+                    raise retrieved[0]
+                template = retrieved[0]
+            else:
+                # Building/pushing an image and creating a template has side effects, so only once an executor exists
                 is_one_time_template, template = await self._client.templates.create_from_image_or_dockerfile(
                     docker_image, dockerfile
-                )   
-            else:
-                template = await self._client.templates.retrieve(template_id)
+                )
             logger.debug(f"Found template: {template.name}({template.id}-{template.docker_image}:{template.docker_image_tag})")
 
             # Find ssh key 
-            ssh_keys = await self._client.ssh_keys.list()
+            if isinstance(ssh_keys, BaseException):
+                raise ssh_keys
             if len(ssh_keys) == 0:
                 raise Exception("No ssh keys found, please add a ssh key to your account")
             logger.debug(f"Found {len(ssh_keys)} ssh keys")
 
             # Create the pod
-            return await self.create(executors[0].id, pod_name or f"lium-pod-{uuid.uuid4()}", template.id, [ssh_keys[0].public_key])
+            return await self.create(executors[0].id, pod_name or f"{pod_name_prefix}-{uuid.uuid4().hex[:12]}", template.id, [ssh_keys[0].public_key])
         except Exception as e:
             if template and is_one_time_template:
                 await self._client.templates.delete(template.id)
@@ -1,14 +1,16 @@
 """/containers endpoints."""
 from __future__ import annotations
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Literal
 import uuid
 
 from lium.models.pod import Pod, PodList
 from lium.utils.logging import logger
+from lium.utils.ttl_cache import ttl_cache, invalidates_ttl_cache
 from lium.resources.base import BaseResource
-from lium.resources.pods.pods_core import _PodsCore
-from lium.models.executor import Executor, ExecutorFilterQuery
+from lium.resources.pods.pods_core import ExecutorSortKey, _PodsCore
+from lium.models.executor import Executor, ExecutorFilterQuery, ExecutorSummary
 
 
 class Pods(BaseResource, _PodsCore):
@@ -21,19 +23,65 @@ class Pods(BaseResource, _PodsCore):
             client.pods.list_executors()
     """
 
-    def list_executors(self, filter_query: ExecutorFilterQuery | dict | None = None) -> list[Executor]:
+    def list_executors(
+        self,
+        filter_query: ExecutorFilterQuery | dict | None = None,
+        *,
+        sort_by: ExecutorSortKey | None = None,
+        sort_order: Literal["asc", "desc"] | None = None,
+        limit: int | None = None,
+    ) -> list[Executor]:
         """
         List all executors. These are the machines from subnet that aren't being rented out.
 
         :param filter_query: Filter query to filter the executors.
         :type filter_query: ExecutorFilterQuery or dict or None
+        :param sort_by: Sort executors by `price`, `gpu_count` or `uptime` (default).
+        :type sort_by: str or None
+        :param sort_order: `asc` or `desc` (default).
+        :type sort_order: str or None
+        :param limit: Only return the first `limit` executors after sorting.
+        :type limit: int or None
         :return: List of executors.
         :rtype: list[Executor]
         """
         args, kwargs = self._list_executors_params(filter_query)
         resp = self._t.request(*args, **kwargs)
-        return self._parse_list_executors_response(self._get_json(resp))
+        return self._parse_sorted_executors(self._get_content(resp), sort_by, sort_order, limit)
+
+    def list_executor_summaries(
+        self,
+        filter_query: ExecutorFilterQuery | dict | None = None,
+        *,
+        sort_by: ExecutorSortKey | None = None,
+        sort_order: Literal["asc", "desc"] | None = None,
+        limit: int | None = None,
+    ) -> list[ExecutorSummary]:
+        """
+        List executors with only id, machine name, price, GPU count and uptime.
+        Faster to parse than :meth:`list_executors` when picking an executor to rent, since
+        every other field of the listing is skipped instead of validated.
+
+        :param filter_query: Filter query to filter the executors.
+        :type filter_query: ExecutorFilterQuery or dict or None
+        :param sort_by: Sort executors by `price`, `gpu_count` or `uptime` (default).
+        :type sort_by: str or None
+        :param sort_order: `asc` or `desc` (default).
+        :type sort_order: str or None
+        :param limit: Only return the first `limit` executors after sorting.
+        :type limit: int or None
+        :return: List of executor summaries.
+        :rtype: list[ExecutorSummary]
+        """
+        args, kwargs = self._list_executors_params(filter_query)
+        resp = self._t.request(*args, **kwargs)
+        return self._parse_sorted_executors(self._get_content(resp), sort_by, sort_order, limit, summary=True)
+
+    @ttl_cache(seconds=10)
+    def _list_executor_summaries_cached(self, filter_query: ExecutorFilterQuery | dict | None = None) -> list[ExecutorSummary]:
+        return self.list_executor_summaries(filter_query)
     
+    @invalidates_ttl_cache
     def create(
         self, 
         id_in_site: uuid.UUID, 
@@ -62,6 +110,7 @@ class Pods(BaseResource, _PodsCore):
         })
         return self.retrieve(id_in_site)
 
+    @invalidates_ttl_cache
     def delete(self, id_in_site: uuid.UUID) -> None:
         """
         Delete a pod.
@@ -95,27 +144,60 @@ class Pods(BaseResource, _PodsCore):
         :return: The retrieved pod.
         :rtype: Pod
         """
-        resp = self._t.request("GET", f"/pods/{id}")
-        elapsed_time = 0
-        pod = None
-        while elapsed_time < timeout:
-            resp = self._t.request("GET", f"/pods/{id}")
-            pod = self._parse_pod_response(self._get_json(resp))
+        url = f"{self.ENDPOINT}/{id}"  # formatted once, not per poll
+        start = time.monotonic()
+        delay = self.POLL_INITIAL_DELAY
+        etag = None
+        while True:
+            # Unchanged pods come back as an empty 304, so the cached pod is reused
+            resp = self._t.request("GET", url, headers={"If-None-Match": etag} if etag else None)
+            if resp.status_code != 304:
+                pod = self._parse_pod_response(self._get_json(resp))
+                etag = resp.headers.get("etag")
             if not wait_until_running or pod.status == "RUNNING":
                 return pod
-            time.sleep(5)
-            elapsed_time += 5
-            logger.debug(f"Pod {id} status: {pod.status}, elapsed time: {elapsed_time}s")
-        return pod
+            if time.monotonic() - start >= timeout:
+                return pod
+            time.sleep(delay)
+            delay = self._next_poll_delay(delay)
+            logger.debug(f"Pod {id} status: {pod.status}, elapsed time: {time.monotonic() - start:.0f}s")
     
+    def wait_until_all_running(self, ids: Iterable[uuid.UUID], timeout: int = 5 * 60) -> dict[uuid.UUID, str]:
+        """
+        Wait until all given pods are running, polling the pod list once per interval.
+
+        :param ids: The ids of the pods.
+        :type ids: Iterable[uuid.UUID]
+        :param timeout: Timeout in seconds to wait for the pods to be running.
+        :type timeout: int, optional
+        :return: Last known status of every pod, keyed by pod id.
+        :rtype: dict[uuid.UUID, str]
+        """
+        pending = {uuid.UUID(str(id)) for id in ids}
+        statuses: dict[uuid.UUID, str] = {}
+        start = time.monotonic()
+        delay = self.POLL_INITIAL_DELAY
+        while pending:
+            # One pod listing per tick covers every pending pod
+            resp = self._t.request("GET", self.ENDPOINT)
+            self._update_pending(pending, statuses, self._parse_pod_statuses_response(self._get_content(resp)))
+            if not pending or time.monotonic() - start >= timeout:
+                break
+            time.sleep(delay)
+            delay = self._next_poll_delay(delay)
+            logger.debug(f"Waiting for {len(pending)} pods, elapsed time: {time.monotonic() - start:.0f}s")
+        return statuses
+
     def easy_deploy(
         self,
         machine_query: str,
         docker_image: str | None = None,
         dockerfile: str | None = None,
         template_id: str | None = None,
-        additional_machine_filter: dict[str, Any] = {},
+        additional_machine_filter: dict[str, Any] | None = None,
         pod_name: str | None = None,
+        use_cache: bool = True,
+        pod_name_prefix: str = "lium-pod",
     ) -> Pod:
         """
         Easy deploy a pod. 
@@ -134,9 +216,14 @@ class Pods(BaseResource, _PodsCore):
         Will use provided template from the platform to deploy a pod.
         :type template_id: str or None
         :param additional_machine_filter: Additional machine filter to filter the executors.
-        :type additional_machine_filter: dict[str, Any]
+        :type additional_machine_filter: dict[str, Any] or None
         :param pod_name: The name of the pod.
         :type pod_name: str or None
+        :param use_cache: Reuse executors listed for the same filter within the last 10 seconds,
+            and SSH keys and verified templates looked up within the last minute.
+        :type use_cache: bool
+        :param pod_name_prefix: Prefix of the generated name when `pod_name` is not given.
+        :type pod_name_prefix: str
         :return: The created pod.
         :rtype: Pod
         """
@@ -145,35 +232,45 @@ class Pods(BaseResource, _PodsCore):
         try:
             # Find matching executor first
             machines, count = self._parse_machine_query(machine_query)
-            executors = self.list_executors(
-                {
-                    "machine_names": machines,
-                    **({"gpu_count_gte": count, "gpu_count_lte": count} if count else {}),
-                    **additional_machine_filter
-                    }
-            )
+            machine_filter: dict[str, Any] = {"machine_names": machines}
+            if count:
+                machine_filter["gpu_count_gte"] = machine_filter["gpu_count_lte"] = count
+            if additional_machine_filter:
+                machine_filter.update(additional_machine_filter)
+            list_executors = self._list_executor_summaries_cached if use_cache else self.list_executor_summaries
+            client = self._client
+            retrieve_template = client.templates._retrieve_cached if use_cache else client.templates.retrieve
+            list_ssh_keys = client.ssh_keys._list_cached if use_cache else client.ssh_keys.list
+
+            # Executors, an existing template and ssh keys are independent reads, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                executors_future = pool.submit(list_executors, machine_filter)
+                ssh_keys_future = pool.submit(list_ssh_keys)
+                template_future = pool.submit(retrieve_template, template_id) if template_id else None
+
+            executors = executors_future.result()
             if len(executors) == 0:
                 logger.warning(f"No executors found for machine query: {machine_query}")
                 return
             logger.debug(f"Found {len(executors)} executors for machine query: {machine_query}")
-            
-            if not template_id:
-                # Find the template to deploy 
+
+            if template_future is not None:
+                template = template_future.result()
+            else:
+                # Building/pushing an image and creating a template has side effects, so only once an executor exists
                 is_one_time_template, template = self._client.templates.create_from_image_or_dockerfile(
                     docker_image, dockerfile
                 )
-            else:
-                template = self._client.templates.retrieve(template_id)
             logger.debug(f"Found template: {template.name}({template.id}-{template.docker_image}:{template.docker_image_tag})")
 
             # Find ssh key 
-            ssh_keys = self._client.ssh_keys.list()
+            ssh_keys = ssh_keys_future.result()
             if len(ssh_keys) == 0:
                 raise Exception("No ssh keys found, please add a ssh key to your account")
             logger.debug(f"Found {len(ssh_keys)} ssh keys")
 
             # Create the pod
-            return self.create(executors[0].id, pod_name or f"lium-pod-{uuid.uuid4()}", template.id, [ssh_keys[0].public_key])
+            return self.create(executors[0].id, pod_name or f"{pod_name_prefix}-{uuid.uuid4().hex[:12]}", template.id, [ssh_keys[0].public_key])
         except Exception as e:
             if template and is_one_time_template:
                 self._client.templates.delete(template.id)
@@ -1,19 +1,64 @@
-from typing import Any
+import heapq
+import re
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Literal, TypeVar
+from uuid import UUID
 
-from lium.models.executor import ExecutorFilterQuery, Executor
-from lium.models.pod import Pod, PodList
+from pydantic import TypeAdapter
+
+from lium.models.executor import ExecutorFilterQuery, Executor, ExecutorSummary
+from lium.models.pod import Pod, PodList, PodStatus
 from lium.utils.machine import get_corrected_machine_names
+from lium.utils.serialization import loads
+
+
+# "[<count>x]<machine>" per comma separated token, e.g. "1XA6000" or "H200"
+_MACHINE_RE = re.compile(r"^\s*(?:(\d+)\s*[xX])?\s*([A-Za-z0-9 ._-]+?)\s*$")
+
+ExecutorSortKey = Literal["price", "gpu_count", "uptime"]
+_E = TypeVar("_E", Executor, ExecutorSummary)
+
+# attrgetter runs in C, avoiding a Python frame per element while sorting
+_SORT_KEYS: dict[str, Callable[[Any], Any]] = {
+    "price": attrgetter("price_per_hour"),
+    "gpu_count": attrgetter("specs.gpu.count"),
+    "uptime": lambda x: x.uptime_in_minutes or 0,
+}
+def _num(value: Any) -> float:
+    """Sort value of a raw field; missing or malformed values rank like 0 and are left to validation."""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Same keys over the raw JSON rows, to pick the top executors before validating them
+_RAW_SORT_KEYS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "price": lambda r: _num(r.get("price_per_hour")),
+    "gpu_count": lambda r: _num(((r.get("specs") or {}).get("gpu") or {}).get("count")),
+    "uptime": lambda r: _num(r.get("uptime_in_minutes")),
+}
 
 
 class _PodsCore:
     ENDPOINT = "/pods"
     EXECUTORS_ENDPOINT = "/executors"
+    POLL_INITIAL_DELAY = 1.0
+    POLL_MAX_DELAY = 15.0
+    # Validates straight from response bytes, skipping the intermediate dicts
+    _EXECUTORS_ADAPTER = TypeAdapter(list[Executor])
+    _EXECUTOR_SUMMARIES_ADAPTER = TypeAdapter(list[ExecutorSummary])
+    # Only id/status of each `GET /pods` row, for polling several pods at once
+    _POD_STATUSES_ADAPTER = TypeAdapter(list[PodStatus])
 
-    def _list_executors_params(self, filter_query: ExecutorFilterQuery | dict | None = None) -> tuple[list[Any], dict[str, Any]]:
+    def _list_executors_params(
+        self, filter_query: ExecutorFilterQuery | dict | None = None
+    ) -> tuple[list[Any], dict[str, Any]]:
         if isinstance(filter_query, dict):
             filter_query = ExecutorFilterQuery.model_validate(filter_query)
+        # Copy: the cached dump is shared by every call made with this filter
+        params = dict(filter_query._dumped_json) if filter_query else {}
         # Fix machine names
-        params = filter_query.model_dump(mode='json', exclude_none=True) if filter_query else None
         if params and "machine_names" in params:
             corrected_machines = get_corrected_machine_names(params["machine_names"])
             if len(corrected_machines) > 0:
@@ -23,20 +68,82 @@ class _PodsCore:
             { "params": params }
         )
 
+    def _next_poll_delay(self, delay: float) -> float:
+        return min(delay * 2, self.POLL_MAX_DELAY)
+
     def _parse_pod_response(self, data: dict[str, Any]) -> Pod:
         return Pod.model_validate(data)
     
     def _parse_list_pods_response(self, data: list[dict[str, Any]]) -> list[PodList]:
         return [PodList.model_validate(r) for r in data]
     
-    def _parse_list_executors_response(self, data: list[dict[str, Any]]) -> list[Executor]:
-        return sorted([Executor.model_validate(r) for r in data], key=lambda x: x.uptime_in_minutes or 0, reverse=True)
+    def _parse_pod_statuses_response(self, content: bytes) -> list[PodStatus]:
+        return self._POD_STATUSES_ADAPTER.validate_json(content)
+
+    @staticmethod
+    def _update_pending(pending: set[UUID], statuses: dict[UUID, str], pods: Iterable[PodStatus]) -> None:
+        """Record the listed statuses of the pending pods and drop the ones now running."""
+        for pod in pods:
+            if pod.id in pending:
+                statuses[pod.id] = pod.status
+                if pod.status == "RUNNING":
+                    pending.discard(pod.id)
+
+    def _parse_list_executors_response(self, content: bytes, summary: bool = False) -> list[Executor] | list[ExecutorSummary]:
+        # Summaries validate the same full rows but skip every field they don't declare
+        if summary:
+            return self._EXECUTOR_SUMMARIES_ADAPTER.validate_json(content)
+        return self._EXECUTORS_ADAPTER.validate_json(content)
+
+    def _sort_executors(
+        self,
+        executors: list[_E],
+        sort_by: ExecutorSortKey = "uptime",
+        sort_order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+    ) -> list[_E]:
+        key = _SORT_KEYS[sort_by]
+        if limit is not None:
+            # Partial selection is O(n log limit) instead of sorting everything
+            select = heapq.nlargest if sort_order == "desc" else heapq.nsmallest
+            return select(limit, executors, key=key)
+        executors.sort(key=key, reverse=sort_order == "desc")
+        return executors
+
+    def _parse_sorted_executors(
+        self,
+        content: bytes,
+        sort_by: ExecutorSortKey | None = None,
+        sort_order: Literal["asc", "desc"] | None = None,
+        limit: int | None = None,
+        summary: bool = False,
+    ) -> list[Executor] | list[ExecutorSummary]:
+        # The API has no sort/limit params, so both always happen here
+        sort_by = sort_by or "uptime"
+        sort_order = sort_order or "desc"
+        if limit is None:
+            return self._sort_executors(self._parse_list_executors_response(content, summary), sort_by, sort_order)
+        rows = loads(content)
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            # Not a list of objects: let validation report it rather than fail in a sort key
+            return self._sort_executors(self._parse_list_executors_response(content, summary), sort_by, sort_order, limit)
+        # Select the top rows on the raw dicts so only `limit` models get validated
+        select = heapq.nlargest if sort_order == "desc" else heapq.nsmallest
+        rows = select(limit, rows, key=_RAW_SORT_KEYS[sort_by])
+        adapter = self._EXECUTOR_SUMMARIES_ADAPTER if summary else self._EXECUTORS_ADAPTER
+        return adapter.validate_python(rows)
     
     def _parse_machine_query(self, machine_query: str) -> tuple[list[str], int | None]:
         """Parse a machine query into a list of machine names.
+
+        A GPU count on the first machine applies to all of them; later machines
+        may repeat it but not give a different one.
         """
-        count = None
-        if "x" in machine_query.lower():
-            count, machine_query = machine_query.split("x")
-            count = int(count)
-        return machine_query.split(","), count
\ No newline at end of file
+        matches = [_MACHINE_RE.match(part) for part in machine_query.split(",")]
+        if not all(matches):
+            raise ValueError(f"Invalid machine query: {machine_query}")
+        count = matches[0].group(1)
+        for m in matches[1:]:
+            if m.group(1) and (not count or int(m.group(1)) != int(count)):
+                raise ValueError(f"Invalid machine query: {machine_query}, all machines must share one GPU count")
+        return [m.group(2) for m in matches], int(count) if count else None
\ No newline at end of file
@@ -1,5 +1,7 @@
+from __future__ import annotations
 from uuid import UUID
 from lium.models.ssh_key import SSHKey
+from lium.utils.ttl_cache import ttl_cache, invalidates_ttl_cache
 from lium.resources.base import BaseAsyncResource
 from lium.resources.ssh_keys.base import _SSHKeysCore
 
@@ -7,6 +9,7 @@ class AsyncSSHKeys(BaseAsyncResource, _SSHKeysCore):
     """
     Async/await version of the SSHKeys resource.
     """
+    @invalidates_ttl_cache
     async def create(self, name: str, public_key: str) -> SSHKey:
         """
         Create an SSH key.
@@ -23,6 +26,7 @@ class AsyncSSHKeys(BaseAsyncResource, _SSHKeysCore):
         )
         return self.parse_one(self._get_json(resp))
 
+    @invalidates_ttl_cache
     async def update(self, id: UUID, name: str, public_key: str) -> SSHKey:
         """
         Update an SSH key.
@@ -37,7 +41,7 @@ class AsyncSSHKeys(BaseAsyncResource, _SSHKeysCore):
         :rtype: SSHKey
         """
         resp = await self._t.arequest(
-            "PUT", f"{self.list_url}{id}", json={"name": name, "public_key": public_key}
+            "PUT", f"{self.ENDPOINT}/{id}", json={"name": name, "public_key": public_key}
         )
         return self.parse_one(self._get_json(resp))
 
@@ -48,9 +52,15 @@ class AsyncSSHKeys(BaseAsyncResource, _SSHKeysCore):
         :return: A list of SSHKey objects.
         :rtype: list[SSHKey]
         """
-        resp = await self._t.arequest("GET", f"{self.list_url}")
+        resp = await self._t.arequest("GET", self.list_url)
         return self.parse_many(self._get_json(resp))
 
+    @ttl_cache(seconds=60)
+    async def _list_cached(self) -> list[SSHKey]:
+        """`list` for easy_deploy: reuses the keys listed within the last minute."""
+        return await self.list()
+
+    @invalidates_ttl_cache
     async def delete(self, id: UUID) -> None:
         """
         Delete an SSH key.
@@ -60,4 +70,4 @@ class AsyncSSHKeys(BaseAsyncResource, _SSHKeysCore):
         :return: None
         :rtype: None
         """
-        await self._t.arequest("DELETE", f"{self.list_url}{id}")
+        await self._t.arequest("DELETE", f"{self.ENDPOINT}/{id}")
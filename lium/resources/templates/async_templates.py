@@ -1,17 +1,35 @@
+from __future__ import annotations
 import asyncio
-import uuid
+from typing import Awaitable, Callable, Iterable, TypeVar
 from uuid import UUID
 from lium.utils.docker import build_and_push_docker_image_from_dockerfile, verify_docker_image_validity
 from lium.utils.logging import logger
+from lium.utils.polling import apoll
 from lium.models.template import Template, TemplateCreate, TemplateUpdate
+from lium.utils.ttl_cache import ttl_cache, invalidates_ttl_cache
 from lium.resources.base import BaseAsyncResource
 from lium.resources.templates.templates_core import _TemplatesCore
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
     """
     Async/await version of the Templates resource.
     """
+    MAX_CONCURRENCY = 20  # in-flight requests for the *_many helpers
+
+    async def _gather_limited(self, fn: Callable[[_T], Awaitable[_R]], items: Iterable[_T]) -> list[_R]:
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def one(item: _T) -> _R:
+            async with sem:
+                return await fn(item)
+
+        return list(await asyncio.gather(*(one(item) for item in items)))
+
+    @invalidates_ttl_cache
     async def create(self, data: TemplateCreate | dict) -> Template:
         """
         Create a template.
@@ -25,7 +43,19 @@ class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
             "POST", self.ENDPOINT, json=self._parse_create_data(data)
         )
         return self.parse_one(self._get_json(resp))
+
+    async def create_many(self, datas: Iterable[TemplateCreate | dict]) -> list[Template]:
+        """
+        Create several templates concurrently.
+
+        :param datas: The data for each new template.
+        :type datas: Iterable[TemplateCreate or dict]
+        :return: The created Template objects, in input order.
+        :rtype: list[Template]
+        """
+        return await self._gather_limited(self.create, datas)
     
+    @invalidates_ttl_cache
     async def update(self, id: UUID, data: TemplateUpdate | dict) -> Template:
         """
         Update a template.
@@ -49,8 +79,8 @@ class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
         :return: A list of Template objects.
         :rtype: list[Template]
         """
-        resp = await self._t.arequest("GET", self.ENDPOINT)
-        return self.parse_many(self._get_json(resp))
+        resp = await self._t.arequest("GET", self.ENDPOINT, headers=self._list_headers())
+        return self._parse_list_response(resp)
     
     async def retrieve(self, id: UUID, wait_until_verified: bool = False) -> Template:
         """
@@ -63,20 +93,31 @@ class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
         :return: The retrieved Template object.
         :rtype: Template
         """
-        max_retries = 30 if wait_until_verified else 1
-        retries = 0
-        while retries < max_retries:
+        async def fetch() -> Template:
             resp = await self._t.arequest("GET", f"{self.ENDPOINT}/{id}")
-            template = self.parse_one(self._get_json(resp))
-            if template.status in ["VERIFY_SUCCESS", "VERIFY_FAILED"]:
-                return template
-            logger.debug(
-                f"Template {id} not verified yet, current status is {template.status}, retrying... ({retries}/{max_retries})"
-            )
-            await asyncio.sleep(3)
-            retries += 1
-        return template
+            return self.parse_one(self._get_json(resp))
+
+        if not wait_until_verified:
+            return await fetch()
+        return await apoll(fetch, self._is_verified, timeout=self.VERIFY_TIMEOUT)
+
+    async def retrieve_many(self, ids: Iterable[UUID]) -> list[Template]:
+        """
+        Retrieve several templates concurrently.
+
+        :param ids: The UUIDs of the templates to retrieve.
+        :type ids: Iterable[UUID]
+        :return: The retrieved Template objects, in input order.
+        :rtype: list[Template]
+        """
+        return await self._gather_limited(self.retrieve, ids)
     
+    @ttl_cache(seconds=60, cache_if=_TemplatesCore._is_final)
+    async def _retrieve_cached(self, id: UUID) -> Template:
+        """`retrieve` for easy_deploy: reuses a verified template looked up within the last minute."""
+        return await self.retrieve(id)
+
+    @invalidates_ttl_cache
     async def delete(self, id: UUID) -> None:
         """
         Delete a template.
@@ -110,14 +151,16 @@ class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
         d_cred = await self._client.docker_credentials.get_default()
         
         if not docker_image:
-            docker_image = f"{d_cred.username}/lium-template-{uuid.uuid4()}:latest"
+            docker_image = self._generated_image_name(d_cred.username)
             logger.debug(f"No docker image provided, generated new docker image: {docker_image}")
             is_one_time_template = True
 
         if dockerfile:
             # Build and push the docker image
-            is_success, built_image_size = build_and_push_docker_image_from_dockerfile(
-                dockerfile, docker_image, d_cred.username, d_cred.password
+            # Docker builds block for minutes; keep them off the event loop
+            is_success, built_image_size = await asyncio.to_thread(
+                build_and_push_docker_image_from_dockerfile,
+                dockerfile, docker_image, d_cred.username, d_cred.password,
             )
             if not is_success:
                 raise Exception("Failed to build and push the docker image.")
@@ -125,39 +168,19 @@ class AsyncTemplates(BaseAsyncResource, _TemplatesCore):
             image_size = built_image_size
 
         # Verify the docker image is valid
-        is_verified = verify_docker_image_validity(docker_image)
+        is_verified = await asyncio.to_thread(verify_docker_image_validity, docker_image)
         if not is_verified:
             raise Exception("Docker image is not valid. Try to update your Dockerfile or provide a valid docker image.")
 
         # Check if the template exists with same docker image. If it does, return the template id.
-        templates = await self._client.templates.list()
-        for template in templates:
-            full_docker_image = f"{template.docker_image}:{template.docker_image_tag}"
-            if full_docker_image == docker_image:
-                return is_one_time_template, template
+        template = self._find_by_image(await self._client.templates.list(), docker_image)
+        if template:
+            return is_one_time_template, template
 
         logger.debug(f"Creating template and waiting for verification: {docker_image}")
 
         # Create the template
-        payload = {
-            "category": "UBUNTU",
-            "description": "",
-            "docker_image": docker_image.split(":")[0],
-            "docker_image_tag": docker_image.split(":")[1],
-            "docker_image_digest": "",
-            "entrypoint": "",
-            "environment": {},
-            "internal_ports": [],
-            "is_private": True,
-            "name": docker_image,
-            "readme": "",
-            "startup_commands": "",
-            "volumes": ["/workspace"],
-            "one_time_template": is_one_time_template,
-            "is_temporary": is_one_time_template,
-            "docker_image_size": image_size,
-            "docker_credential_id": str(d_cred.id),
-        }
+        payload = self._image_template_payload(docker_image, is_one_time_template, image_size, d_cred)
         resp = await self._t.arequest("POST", self.ENDPOINT, json=payload)
         template = self.parse_one(self._get_json(resp))
         return (is_one_time_template, await self.retrieve(template.id, wait_until_verified=True))
\ No newline at end of file
@@ -1,9 +1,9 @@
-import time
-import uuid
 from uuid import UUID
 from lium.utils.docker import build_and_push_docker_image_from_dockerfile, verify_docker_image_validity
 from lium.utils.logging import logger
+from lium.utils.polling import poll
 from lium.models.template import Template, TemplateCreate, TemplateUpdate
+from lium.utils.ttl_cache import ttl_cache, invalidates_ttl_cache
 from lium.resources.base import BaseResource
 from lium.resources.templates.templates_core import _TemplatesCore
 
@@ -12,6 +12,7 @@ class Templates(BaseResource, _TemplatesCore):
     """
     Resource to manage templates.
     """
+    @invalidates_ttl_cache
     def create(self, data: TemplateCreate | dict) -> Template:
         """
         Create a template.
@@ -26,6 +27,7 @@ class Templates(BaseResource, _TemplatesCore):
         )
         return self.parse_one(self._get_json(resp))
     
+    @invalidates_ttl_cache
     def update(self, id: UUID, data: TemplateUpdate | dict) -> Template:
         """
         Update a template.
@@ -49,8 +51,8 @@ class Templates(BaseResource, _TemplatesCore):
         :return: A list of Template objects.
         :rtype: list[Template]
         """
-        resp = self._t.request("GET", self.ENDPOINT)
-        return self.parse_many(self._get_json(resp))
+        resp = self._t.request("GET", self.ENDPOINT, headers=self._list_headers())
+        return self._parse_list_response(resp)
     
     def retrieve(self, id: UUID, wait_until_verified: bool = False) -> Template:
         """
@@ -63,20 +65,20 @@ class Templates(BaseResource, _TemplatesCore):
         :return: The retrieved Template object.
         :rtype: Template
         """
-        max_retries = 30 if wait_until_verified else 1
-        retries = 0
-        while retries < max_retries:
+        def fetch() -> Template:
             resp = self._t.request("GET", f"{self.ENDPOINT}/{id}")
-            template = self.parse_one(self._get_json(resp))
-            if template.status in ["VERIFY_SUCCESS", "VERIFY_FAILED"]:
-                return template
-            logger.debug(
-                f"Template {id} not verified yet, current status is {template.status}, retrying... ({retries}/{max_retries})"
-            )
-            time.sleep(3)
-            retries += 1
-        return template
+            return self.parse_one(self._get_json(resp))
+
+        if not wait_until_verified:
+            return fetch()
+        return poll(fetch, self._is_verified, timeout=self.VERIFY_TIMEOUT)
+
+    @ttl_cache(seconds=60, cache_if=_TemplatesCore._is_final)
+    def _retrieve_cached(self, id: UUID) -> Template:
+        """`retrieve` for easy_deploy: reuses a verified template looked up within the last minute."""
+        return self.retrieve(id)
 
+    @invalidates_ttl_cache
     def delete(self, id: UUID) -> None:
         """
         Delete a template.
@@ -110,7 +112,7 @@ class Templates(BaseResource, _TemplatesCore):
         d_cred = self._client.docker_credentials.get_default()
         
         if not docker_image:
-            docker_image = f"{d_cred.username}/lium-template-{uuid.uuid4()}:latest"
+            docker_image = self._generated_image_name(d_cred.username)
             logger.debug(f"No docker image provided, generated new docker image: {docker_image}")
             is_one_time_template = True
 
@@ -130,34 +132,14 @@ class Templates(BaseResource, _TemplatesCore):
             raise Exception("Docker image is not valid. Try to update your Dockerfile or provide a valid docker image.")
 
         # Check if the template exists with same docker image. If it does, return the template id.
-        templates = self._client.templates.list()
-        for template in templates:
-            full_docker_image = f"{template.docker_image}:{template.docker_image_tag}"
-            if full_docker_image == docker_image:
-                return is_one_time_template, template
+        template = self._find_by_image(self._client.templates.list(), docker_image)
+        if template:
+            return is_one_time_template, template
 
         logger.debug(f"Creating template and waiting for verification: {docker_image}")
 
         # Create the template
-        payload = {
-            "category": "UBUNTU",
-            "description": "",
-            "docker_image": docker_image.split(":")[0],
-            "docker_image_tag": docker_image.split(":")[1],
-            "docker_image_digest": "",
-            "entrypoint": "",
-            "environment": {},
-            "internal_ports": [],
-            "is_private": True,
-            "name": docker_image,
-            "readme": "",
-            "startup_commands": "",
-            "volumes": ["/workspace"],
-            "one_time_template": is_one_time_template,
-            "is_temporary": is_one_time_template,
-            "docker_image_size": image_size,
-            "docker_credential_id": str(d_cred.id),
-        }
+        payload = self._image_template_payload(docker_image, is_one_time_template, image_size, d_cred)
         resp = self._t.request("POST", self.ENDPOINT, json=payload)
         template = self.parse_one(self._get_json(resp))
         return (is_one_time_template, self.retrieve(template.id, wait_until_verified=True))
\ No newline at end of file
@@ -1,9 +1,25 @@
+import uuid
 from typing import Any
+from lium.models.docker_credentials import DockerCredential
 from lium.models.template import Template, TemplateCreate, TemplateUpdate
+from lium.utils.logging import logger
 
 
 class _TemplatesCore:
     ENDPOINT = "/templates"
+    VERIFIED_STATUSES = ("VERIFY_SUCCESS", "VERIFY_FAILED")
+    VERIFY_TIMEOUT = 90.0
+
+    @staticmethod
+    def _is_final(template: Template) -> bool:
+        """Whether the template's status can no longer change, so a cached copy stays accurate."""
+        return template.status in _TemplatesCore.VERIFIED_STATUSES
+
+    def _is_verified(self, template: Template) -> bool:
+        if template.status in self.VERIFIED_STATUSES:
+            return True
+        logger.debug(f"Template {template.id} not verified yet, current status is {template.status}")
+        return False
 
     def parse_many(self, data: list[dict[str, Any]]) -> list[Template]:
         return [Template.model_validate(r) for r in data]
@@ -11,6 +27,62 @@ class _TemplatesCore:
     def parse_one(self, data: dict[str, Any]) -> Template:
         return Template.model_validate(data)
 
+    def _list_headers(self) -> dict[str, str] | None:
+        cached = self.__dict__.get("_list_cache")
+        return {"If-None-Match": cached[0]} if cached else None
+
+    def _parse_list_response(self, resp) -> list[Template]:
+        # Unchanged catalog comes back as an empty 304; reuse the templates parsed with that ETag
+        cached = self.__dict__.get("_list_cache")
+        if resp.status_code == 304 and cached:
+            return list(cached[1])
+        templates = self.parse_many(self._get_json(resp))
+        if etag := resp.headers.get("etag"):
+            self._list_cache = (etag, templates)
+        else:
+            self.__dict__.pop("_list_cache", None)
+        return list(templates)
+
+    def _generated_image_name(self, username: str) -> str:
+        return f"{username}/lium-template-{uuid.uuid4()}:latest"
+
+    def _find_by_image(self, templates: list[Template], docker_image: str) -> Template | None:
+        # `templates` comes straight from list(), so an index built for the current ETag still matches it
+        etag = self.__dict__.get("_list_cache", (None,))[0]
+        cached = self.__dict__.get("_image_index")
+        if etag and cached and cached[0] == etag:
+            index = cached[1]
+        else:
+            # reversed() so the first template with a given image wins, as with a linear scan
+            index = {f"{t.docker_image}:{t.docker_image_tag}": t for t in reversed(templates)}
+            if etag:
+                self._image_index = (etag, index)
+        return index.get(docker_image)
+
+    def _image_template_payload(
+        self, docker_image: str, is_one_time_template: bool, image_size: int | None, d_cred: DockerCredential
+    ) -> dict[str, Any]:
+        image, tag = docker_image.split(":")[:2]
+        return {
+            "category": "UBUNTU",
+            "description": "",
+            "docker_image": image,
+            "docker_image_tag": tag,
+            "docker_image_digest": "",
+            "entrypoint": "",
+            "environment": {},
+            "internal_ports": [],
+            "is_private": True,
+            "name": docker_image,
+            "readme": "",
+            "startup_commands": "",
+            "volumes": ["/workspace"],
+            "one_time_template": is_one_time_template,
+            "is_temporary": is_one_time_template,
+            "docker_image_size": image_size,
+            "docker_credential_id": str(d_cred.id),
+        }
+
     def _parse_create_data(self, data: TemplateCreate | dict) -> dict:
         if isinstance(data, dict):
             data = TemplateCreate.model_validate(data)
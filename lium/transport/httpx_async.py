@@ -5,6 +5,7 @@ from typing import Any
 import httpx
 from .base import ResponseLike, Transport
 from ..utils.logging import logger, scrub_headers
+from ..utils.serialization import dumps
 
 
 class HttpxAsyncTransport(Transport):
@@ -15,9 +16,22 @@ class HttpxAsyncTransport(Transport):
         default_headers: dict[str, str],
         timeout: float,
         max_retries: int,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=timeout)
+        # One pooled client per transport so keep-alive connections (and their
+        # TCP/TLS state) are reused across requests. A shared `transport` lets
+        # several clients draw from the same pool; limits/http2 then come from it.
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=default_headers,
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=http2,
+            transport=transport,
+        )
         self._default_headers = default_headers
         self._max_retries = max_retries
 
@@ -32,14 +46,17 @@ class HttpxAsyncTransport(Transport):
         headers: dict[str, str] | None,
     ) -> ResponseLike:
         url = f"{self._base_url}{path}"
-        hdrs = {**self._default_headers, **(headers or {})}
+        content = None
+        if json is not None:
+            content = dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
 
         for attempt in range(self._max_retries + 1):
             if attempt:
                 logger.debug("Retrying {} {} (attempt {})", method, url, attempt + 1)
 
             resp = await self._client.request(
-                method, url, params=params, json=json, headers=hdrs
+                method, path, params=params, content=content, headers=headers
             )
 
             if resp.status_code >= 500 and attempt < self._max_retries:
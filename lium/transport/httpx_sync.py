@@ -6,6 +6,7 @@ import httpx
 
 from .base import ResponseLike, Transport
 from ..utils.logging import logger, scrub_headers
+from ..utils.serialization import dumps
 
 
 class HttpxSyncTransport(Transport):
@@ -16,9 +17,22 @@ class HttpxSyncTransport(Transport):
         default_headers: dict[str, str],
         timeout: float,
         max_retries: int,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
     ):
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=timeout)
+        # One pooled client per transport so keep-alive connections (and their
+        # TCP/TLS state) are reused across requests. A shared `transport` lets
+        # several clients draw from the same pool; limits/http2 then come from it.
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            headers=default_headers,
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=http2,
+            transport=transport,
+        )
         self._default_headers = default_headers
         self._max_retries = max_retries
 
@@ -33,18 +47,23 @@ class HttpxSyncTransport(Transport):
         headers: dict[str, str] | None,
     ) -> ResponseLike:
         url = f"{self._base_url}{path}"
-        hdrs = {**self._default_headers, **(headers or {})}
+        content = None
+        if json is not None:
+            content = dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
 
         for attempt in range(self._max_retries + 1):
             if attempt:
                 logger.debug("Retrying {} {} (attempt {})", method, url, attempt + 1)
 
             resp = self._client.request(
-                method, url, params=params, json=json, headers=hdrs
+                method, path, params=params, content=content, headers=headers
             )
 
             if resp.status_code >= 500 and attempt < self._max_retries:
                 continue
+            if resp.status_code == 304:  # conditional GET hit; caller keeps its copy
+                return resp
             resp.raise_for_status()
             return resp  # may be non-2xx; resource will map to error.
 
@@ -0,0 +1,53 @@
+"""Process-wide httpx connection pools shared between clients."""
+from __future__ import annotations
+import atexit
+import threading
+
+import httpx
+
+__all__ = ["get_shared_pool"]
+
+
+class _SharedHTTPTransport(httpx.HTTPTransport):
+    """Pool that outlives the clients using it; closing a client leaves it open."""
+
+    def close(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        super().close()
+
+
+_lock = threading.Lock()
+_pools: dict[tuple, _SharedHTTPTransport] = {}
+
+
+def get_shared_pool(limits: httpx.Limits | None = None, http2: bool = False) -> httpx.HTTPTransport:
+    """
+    Return the process-wide sync connection pool for the given settings.
+
+    Every `Client` built with the same limits reuses the same keep-alive
+    connections instead of opening (and TLS-handshaking) its own.
+
+    :param limits: Connection pool limits.
+    :type limits: httpx.Limits or None
+    :param http2: Whether to negotiate HTTP/2.
+    :type http2: bool
+    :return: Shared transport to pass as `httpx.Client(transport=...)`.
+    :rtype: httpx.HTTPTransport
+    """
+    limits = limits or httpx.Limits()
+    key = (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry, http2)
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = _SharedHTTPTransport(limits=limits, http2=http2)
+        return pool
+
+
+@atexit.register
+def _close_shared_pools() -> None:
+    with _lock:
+        for pool in _pools.values():
+            pool._close()
+        _pools.clear()
@@ -0,0 +1,51 @@
+"""Polling with capped exponential back-off and jitter (sync + async)."""
+from __future__ import annotations
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+__all__ = ["backoff_delay", "poll", "apoll"]
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Delay before probe `attempt + 1`: dense first, tapering to `cap`, jittered so callers don't sync up."""
+    return min(cap, base * 2 ** attempt) + random.uniform(0, base)
+
+
+def poll(
+    fn: Callable[[], T],
+    is_done: Callable[[T], bool],
+    timeout: float,
+    base: float = 0.5,
+    cap: float = 15.0,
+) -> T:
+    """Call `fn` until `is_done(result)` or `timeout` seconds pass; return the last result."""
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        result = fn()
+        if is_done(result) or time.monotonic() - start >= timeout:
+            return result
+        time.sleep(backoff_delay(attempt, base, cap))
+        attempt += 1
+
+
+async def apoll(
+    fn: Callable[[], Awaitable[T]],
+    is_done: Callable[[T], bool],
+    timeout: float,
+    base: float = 0.5,
+    cap: float = 15.0,
+) -> T:
+    """Async variant of :func:`poll`; sleeps without blocking the event loop."""
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        result = await fn()
+        if is_done(result) or time.monotonic() - start >= timeout:
+            return result
+        await asyncio.sleep(backoff_delay(attempt, base, cap))
+        attempt += 1
@@ -0,0 +1,24 @@
+"""JSON encode/decode helpers; uses orjson when it is installed."""
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["loads", "dumps"]
+
+try:
+    import orjson
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - optional speed-up
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
@@ -0,0 +1,118 @@
+"""Small per-resource TTL cache for idempotent reads.
+
+Usage
+-----
+class SSHKeys(BaseResource):
+    @ttl_cache(seconds=60)
+    def _list_cached(self): ...
+
+    @invalidates_ttl_cache
+    def create(self, ...): ...
+"""
+from __future__ import annotations
+
+import copy
+import inspect
+import time
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+__all__ = ["ttl_cache", "invalidates_ttl_cache", "clear_ttl_cache"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CACHE_ATTR = "_ttl_cache"
+
+
+def _freeze(value: Any) -> Any:
+    """Turn dict/list/set/model arguments into something hashable for the cache key."""
+    if hasattr(value, "model_dump"):
+        # Pydantic models key by their query params, so a model and the dict it came from share an entry
+        return _freeze(value.model_dump(mode="json", exclude_none=True))
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _store(resource: Any) -> dict:
+    return resource.__dict__.setdefault(_CACHE_ATTR, {})
+
+
+def clear_ttl_cache(resource: Any) -> None:
+    """Drop every cached entry held by `resource`."""
+    resource.__dict__.pop(_CACHE_ATTR, None)
+
+
+def ttl_cache(seconds: float, cache_if: Callable[[Any], bool] | None = None) -> Callable[[F], F]:
+    """Cache a resource method's result per arguments for `seconds`.
+
+    Works for both sync and `async def` methods; the cache lives on the
+    resource instance, so each client keeps its own entries. Every call
+    gets its own deep copy, so callers can't mutate the cached value.
+    Results for which `cache_if(result)` is false are returned but not kept.
+    """
+
+    def decorator(fn: F) -> F:
+        def _key(args: tuple, kwargs: dict) -> Any:
+            return (fn, _freeze(args), _freeze(kwargs))
+
+        def _lookup(store: dict, key: Any) -> tuple[bool, Any]:
+            hit = store.get(key)
+            if hit and hit[0] > time.monotonic():
+                return True, copy.deepcopy(hit[1])
+            return False, None
+
+        def _remember(store: dict, key: Any, value: Any) -> Any:
+            if cache_if is None or cache_if(value):
+                store[key] = (time.monotonic() + seconds, value)
+                return copy.deepcopy(value)
+            return value
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                key = _key(args, kwargs)
+                store = _store(self)
+                found, value = _lookup(store, key)
+                if found:
+                    return value
+                return _remember(store, key, await fn(self, *args, **kwargs))
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = _key(args, kwargs)
+            store = _store(self)
+            found, value = _lookup(store, key)
+            if found:
+                return value
+            return _remember(store, key, fn(self, *args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates_ttl_cache(fn: F) -> F:
+    """Clear the resource's TTL cache after a mutating call succeeds."""
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            result = await fn(self, *args, **kwargs)
+            clear_ttl_cache(self)
+            return result
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        result = fn(self, *args, **kwargs)
+        clear_ttl_cache(self)
+        return result
+
+    return wrapper  # type: ignore[return-value]
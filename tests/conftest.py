@@ -3,14 +3,23 @@
 import os
 import time
 import uuid
+import random
+import datetime
 import pytest
 import logging
-from typing import Generator, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional
 from lium_sdk import Lium, PodInfo
 
 # Suppress paramiko INFO logs (only show warnings and errors)
 logging.getLogger("paramiko").setLevel(logging.WARNING)
 
+# Bodies for test_files_content, filled in per test with a fresh run id and timestamp
+_TEST_FILE_TEMPLATES = {
+    "/root/test_file1.txt": "Test run ID: {uid}\nTimestamp: {ts}\nPierre's secret recipe #1\nLine 2 of file 1",
+    "/root/test_file2.txt": "Test run ID: {uid}\nTimestamp: {ts}\nPierre's baguette formula\nWith multiple lines\nAnd more data\nRandom: {rand}",
+    "/root/test_dir/nested_file.txt": "Test run ID: {uid}\nNested file in directory\nPierre's croissant technique\nTimestamp: {ts}",
+}
+
 
 @pytest.fixture(scope="session")
 def lium_client() -> Lium:
@@ -40,94 +49,107 @@ def test_pod_name() -> str:
 
 
 @pytest.fixture(scope="function")
-def pod_lifecycle(lium_client: Lium, test_pod_name: str) -> Generator[Optional[PodInfo], None, None]:
+def make_pod(lium_client: Lium) -> Generator[Callable[..., Any], None, None]:
+    """
+    Factory fixture that rents pods for a test and stops them all afterwards.
+
+    ``make_pod(executor_id, name, template_id)`` creates a pod and waits for it
+    to be ready. With ``wait=False`` it returns the ``up()`` result at once, so
+    the caller can let the pod boot while doing other work and call
+    ``wait_ready`` later.
+    """
+    created: List[Dict[str, Any]] = []
+
+    def _make(executor_id: str, name: str, template_id: Optional[str] = None,
+              wait: bool = True, timeout: float = 1800) -> Any:
+        pod = lium_client.up(executor_id=executor_id, pod_name=name, template_id=template_id)
+        created.append(pod)
+        if not wait:
+            return pod
+        ready = lium_client.wait_ready(pod, timeout=timeout)
+        if not ready:
+            pytest.fail(f"Pod {name} failed to become ready within {timeout:.0f}s")
+        print(f"Pod {ready.name} is ready!")
+        return ready
+
+    yield _make
+
+    # Stop every pod the test rented, concurrently, even if it failed halfway;
+    # rm is an alias for down, so one successful call is the whole cleanup
+    if not created:
+        return
+    names = {pod["id"]: pod.get("name", pod["id"]) for pod in created}
+    try:
+        print(f"\nCleaning up pods: {', '.join(names.values())}")
+        for res in lium_client.down_all(list(names)):
+            if not res["success"]:
+                print(f"Warning: Failed to cleanup pod {names[res['pod']]}: {res['error']}")
+        # Briefly confirm the pods left the listing; a slow removal is reported, not waited out
+        delay, deadline = 0.2, time.monotonic() + 5
+        while (listed := {p.id for p in lium_client.ps()} & names.keys()) and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+        for pod_id, name in names.items():
+            if pod_id in listed:
+                print(f"Warning: Pod {name} is still listed after down() - check it isn't left running")
+            else:
+                print(f"Pod {name} cleaned up successfully")
+    except Exception as e:
+        print(f"Warning: Failed to cleanup pods: {e}")
+
+
+@pytest.fixture(scope="function")
+def pod_lifecycle(lium_client: Lium, make_pod, test_pod_name: str) -> PodInfo:
     """
-    Fixture that creates a pod, yields it for testing, then cleans up.
+    Fixture that creates a pod and hands it to the test; make_pod cleans it up.
     
     This fixture handles the full lifecycle:
-    1. Creates a pod with the cheapest available executor
+    1. Creates a pod with the best available executor
     2. Waits for it to be ready
-    3. Yields the pod for testing
-    4. Cleans up by stopping and removing the pod
+    3. Hands the pod to the test
+    4. Cleans up by stopping the pod (make_pod's teardown)
     """
-    pod = None
-    try:
-        # Find the best available executor - Pierre doesn't care about money!
-        executors = lium_client.ls()
-        if not executors:
-            pytest.skip("No executors available")
-        
-        # Pierre wants the best GPU - preferably H100, then A100, then whatever
-        gpu_preference = os.getenv("LIUM_GPU_TYPE", "H100,A100").split(",")
-        
-        executor = None
-        for gpu_type in gpu_preference:
-            for e in executors:
-                if gpu_type.lower() in e.gpu_type.lower():
-                    executor = e
-                    break
-            if executor:
+    # Find the best available executor - Pierre doesn't care about money!
+    executors = lium_client.ls()
+    if not executors:
+        pytest.skip("No executors available")
+    
+    # Pierre wants the best GPU - preferably H100, then A100, then whatever
+    gpu_preference = os.getenv("LIUM_GPU_TYPE", "H100,A100").split(",")
+    
+    executor = None
+    for gpu_type in gpu_preference:
+        for e in executors:
+            if gpu_type.lower() in e.gpu_type.lower():
+                executor = e
                 break
-        
-        # If no preferred GPU found, just get the most expensive one (probably the best!)
-        if not executor:
-            executor = sorted(executors, key=lambda x: x.price_per_hour, reverse=True)[0]
-        
-        print(f"\nUsing executor: {executor.huid} ({executor.gpu_type}) @ ${executor.price_per_hour}/h")
-        if os.getenv("PIERRE_STORY"):
-            print(f"🥖 Pierre: Magnifique! The {executor.gpu_type} - perfect for my artisanal ML models!")
-        
-        # Use specific template that works
-        # Template: PyTorch 2.4.0-py3.12-cuda12.2.0-devel-ubuntu22.04
-        template_id = "8c273d47-33fc-4237-805f-e96e685c53b8"
-        
-        # Create the pod
-        pod = lium_client.up(
-            executor_id=executor.id,
-            pod_name=test_pod_name,
-            template_id=template_id
-        )
-        
-        # Wait for pod to be ready (30 minutes timeout)
-        pod = lium_client.wait_ready(pod, timeout=1800)  # 30 minutes
-        if not pod:
-            # Pod didn't become ready, but we still need to clean it up
-            # Try to get the pod info for cleanup
-            pods = lium_client.ps()
-            pod = next((p for p in pods if p.name == test_pod_name), None)
-            if not pod:
-                pytest.fail("Pod failed to become ready and cannot be found for cleanup")
-            pytest.fail("Pod failed to become ready within 30 minutes")
-        
-        print(f"Pod {pod.name} is ready!")
-        
-        yield pod
-        
-    finally:
-        # Cleanup: stop and remove the pod
-        if pod:
-            try:
-                print(f"\nCleaning up pod: {pod.name}")
-                lium_client.down(pod)
-                time.sleep(2)  # Give it a moment to stop
-                lium_client.rm(pod)
-                print(f"Pod {pod.name} cleaned up successfully")
-            except Exception as e:
-                print(f"Warning: Failed to cleanup pod {pod.name}: {e}")
+        if executor:
+            break
+    
+    # If no preferred GPU found, just get the most expensive one (probably the best!)
+    if not executor:
+        executor = max(executors, key=lambda x: x.price_per_hour)
+    
+    print(f"\nUsing executor: {executor.huid} ({executor.gpu_type}) @ ${executor.price_per_hour}/h")
+    if os.getenv("PIERRE_STORY"):
+        print(f"🥖 Pierre: Magnifique! The {executor.gpu_type} - perfect for my artisanal ML models!")
+    
+    # Use specific template that works
+    # Template: PyTorch 2.4.0-py3.12-cuda12.2.0-devel-ubuntu22.04
+    template_id = "8c273d47-33fc-4237-805f-e96e685c53b8"
+    
+    # Create the pod and wait for it to be ready (30 minutes timeout)
+    return make_pod(executor.id, test_pod_name, template_id, timeout=1800)
 
 
 @pytest.fixture
-def test_files_content() -> dict:
+def test_files_content() -> dict[str, bytes]:
     """Test files with content for backup/restore testing."""
     # Generate unique content with timestamp and random ID to ensure uniqueness
-    import random
-    import datetime
-    
-    unique_id = str(uuid.uuid4())[:8]
-    timestamp = datetime.datetime.now().isoformat()
-    
-    return {
-        "/root/test_file1.txt": f"Test run ID: {unique_id}\nTimestamp: {timestamp}\nPierre's secret recipe #1\nLine 2 of file 1",
-        "/root/test_file2.txt": f"Test run ID: {unique_id}\nTimestamp: {timestamp}\nPierre's baguette formula\nWith multiple lines\nAnd more data\nRandom: {random.randint(1000, 9999)}",
-        "/root/test_dir/nested_file.txt": f"Test run ID: {unique_id}\nNested file in directory\nPierre's croissant technique\nTimestamp: {timestamp}",
+    fields = {
+        "uid": uuid.uuid4().hex[:8],
+        "ts": datetime.datetime.now().isoformat(),
+        "rand": random.randint(1000, 9999),
     }
+    # Encoded here, once, as the bytes the tests upload and hash
+    return {path: template.format(**fields).encode() for path, template in _TEST_FILE_TEMPLATES.items()}
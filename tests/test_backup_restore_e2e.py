@@ -1,57 +1,89 @@
 """End-to-end tests for backup and restore functionality."""
 
-import os, time, base64, hashlib, pytest
+import io, os, sys, time, base64, hashlib, logging, logging.handlers, shlex, tarfile, pytest
 from typing import Dict
 from lium_sdk import Lium
 
+TEST_BUDGET = 3600      # hard limit for the whole test
+CLEANUP_RESERVE = 120   # left for teardown when our own waits run out
 POLL_MAX = 900          # 15 min max for each phase
-POLL_MIN = 2.0
-POLL_MAX_STEP = 20.0
+POLL_MIN = 0.5
+POLL_MAX_STEP = 10.0
 DEFAULT_TEMPLATE_ID = "1948937e-5049-47ad-8e26-bcf1a4549d70"  # Default PyTorch template
 
+_story = logging.getLogger("pierre")
+_story.propagate = False  # pytest's log_cli would otherwise echo every line unbuffered
+
 def _backoff(i:int)->float:
-    return min(POLL_MIN * (1.6 ** i), POLL_MAX_STEP)
+    return min(POLL_MIN * (2 ** i), POLL_MAX_STEP)
 
 def _sha256(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
-def _put_file(lium: Lium, pod, path: str, content: bytes):
-    b64 = base64.b64encode(content).decode()
-    # avoids quoting/newline issues
-    lium.exec(pod, f"mkdir -p $(dirname {path}) && echo {b64} | base64 -d > {path}")
+def _tar_bytes(files: Dict[str, bytes]) -> bytes:
+    """In-memory gzipped tar of absolute path -> content (stored relative to /)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        for path, data in files.items():
+            info = tarfile.TarInfo(path.lstrip("/"))
+            info.size, info.mtime = len(data), int(time.time())
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+def _put_files(lium: Lium, pod, files: Dict[str, bytes]) -> Dict[str, str]:
+    """Unpack every file from one tar and verify its SHA256 on the pod in one exec; returns path -> sha256."""
+    expected = {path: _sha256(data) for path, data in files.items()}
+    b64 = base64.b64encode(_tar_bytes(files)).decode()
+    sums = "\n".join(f"{digest}  {path}" for path, digest in expected.items())
+    # tar creates the parent directories; base64 keeps any bytes shell-safe
+    r = lium.exec(pod, f"set -e\necho {b64} | base64 -d | tar -xz -C /\nsha256sum -c <<'SUMS'\n{sums}\nSUMS")
+    assert r["exit_code"] == 0, f"Pierre screams: File corruption! {r['stdout']}{r['stderr']}"
+    return expected
 
-def _read_file(lium: Lium, pod, path: str) -> bytes:
-    r = lium.exec(pod, f"cat {path} | base64 -w0")
-    return base64.b64decode(r["stdout"].strip())
+def _remote_sha256(lium: Lium, pod, paths) -> Dict[str, str]:
+    """path -> sha256 for those of `paths` that exist on the pod, in one exec."""
+    r = lium.exec(pod, "sha256sum -- " + " ".join(shlex.quote(p) for p in paths) + " 2>/dev/null")
+    return {path: digest for digest, path in (line.split(None, 1) for line in r["stdout"].splitlines() if line.strip())}
 
 def _wait_until(fn, desc: str, max_s=POLL_MAX):
-    t0 = time.time()
+    t0 = time.monotonic()
     i = 0
     while True:
         ok, data = fn()
         if ok: return data
         dt = _backoff(i); i += 1
-        if time.time() - t0 + dt > max_s:
+        if time.monotonic() - t0 + dt > max_s:
             pytest.fail(f"timeout waiting for {desc}")
         time.sleep(dt)
 
+def _precheck(files: Dict[str, bytes], backup_path: str = "/root"):
+    """Fail before renting anything if the run can't possibly pass."""
+    if not files:
+        pytest.fail("Pierre has no files to back up - nothing to test")
+    outside = [p for p in files if not p.startswith(backup_path.rstrip("/") + "/")]
+    if outside:
+        pytest.fail(f"Pierre's files {outside} are outside {backup_path} and would never be restored")
+
 def _get_best_executor(lium_client, gpu_preference, purpose="use"):
     """Find best available executor from GPU preference list. Pierre wants the best!"""
+    executors = lium_client.ls()  # one catalog fetch, filtered per preference
     for gpu_type in gpu_preference:
-        exes = [e for e in lium_client.ls() if gpu_type.strip() in (e.gpu_type or "")]
+        exes = [e for e in executors if gpu_type.strip() in (e.gpu_type or "")]
         if exes:
-            exe = sorted(exes, key=lambda x: x.price_per_hour, reverse=True)[0]
+            exe = max(exes, key=lambda x: x.price_per_hour)
             return exe, gpu_type
     pytest.fail(f"Pierre panics: No GPUs available for {purpose} from {gpu_preference}!")
 
 class TestBackupRestoreE2E:
     """Test backup and restore functionality end-to-end."""
     
-    @pytest.mark.timeout(3600)  # 60 minutes timeout for the entire test
+    # signal: the timeout raises inside the test, so the finally-block still deletes the pods
+    @pytest.mark.timeout(TEST_BUDGET, method="signal")
     @pytest.mark.e2e
     def test_backup_and_restore_cycle(
         self, 
         lium_client: Lium, 
+        make_pod,
         test_pod_name: str,
         test_files_content: Dict[str, bytes]
     ):
@@ -60,12 +92,23 @@ class TestBackupRestoreE2E:
         Pierre's epic journey to protect his baguette classifier from disaster.
         """
         verbose = os.getenv("PIERRE_STORY") == "1"
-        created = {"pods": [], "backup_config_id": None}
+        # Every wait draws on one budget, so a slow phase shortens the later ones
+        deadline = time.monotonic() + TEST_BUDGET - CLEANUP_RESERVE
+        
+        def remaining(cap: float) -> float:
+            return max(0.0, min(cap, deadline - time.monotonic()))
+        created = {"backup_config_id": None}
         
-        def log(msg): 
-            print(msg) if verbose else None
+        # Story lines are written in batches of 64; warnings and teardown flush at once
+        story_out = logging.handlers.MemoryHandler(
+            64, flushLevel=logging.WARNING, target=logging.StreamHandler(sys.stdout))
+        _story.addHandler(story_out)
+        _story.setLevel(logging.INFO if verbose else logging.WARNING)
+        log = _story.info
         
         try:
+            _precheck(test_files_content)
+            
             # Pierre needs the best GPU money can buy for his revolutionary AI
             log("=== Pierre rents premium GPUs ===")
             gpu_preference = os.getenv("LIUM_GPU_TYPE", "A100,H100,H200").split(",")
@@ -76,22 +119,18 @@ class TestBackupRestoreE2E:
             
             # Pierre creates his first pod with his favorite PyTorch template
             template_id = os.getenv("LIUM_TEMPLATE_ID", DEFAULT_TEMPLATE_ID)
-            pod1 = lium_client.up(executor_id=exe.id, pod_name=f"{test_pod_name}-src", template_id=template_id)
-            created["pods"].append(pod1)
-            
-            # Pierre waits patiently for his pod to boot up
-            pod1 = lium_client.wait_ready(pod1, timeout=1800)
-            assert pod1, "Pierre's pod never started - considers switching careers to farming"
+            # and waits patiently for it to boot up; make_pod stops every pod it rented at teardown
+            pod1 = make_pod(exe.id, f"{test_pod_name}-src", template_id, timeout=remaining(1800))
             log(f"Pod {pod1.name} is ready!")
             
+            # Pierre rents the restoration pod now so it boots while he uploads and backs up;
+            # up() returns at once, only wait_ready() below blocks on the boot
+            exe2, gpu_type2 = _get_best_executor(lium_client, gpu_preference, "restore")
+            log(f"Pierre found another {gpu_type2} for restore: ${exe2.price_per_hour}/hour")
+            pod2 = make_pod(exe2.id, f"{test_pod_name}-dst", template_id, wait=False)
+            
             # Pierre uploads his super important research files (definitely not just memes)
-            expected = {}
-            for path, content in test_files_content.items():
-                data = content if isinstance(content, bytes) else content.encode()
-                _put_file(lium_client, pod1, path, data)
-                roundtrip = _read_file(lium_client, pod1, path)
-                assert roundtrip == data, f"Pierre screams: File corruption at {path}!"
-                expected[path] = _sha256(data)
+            expected = _put_files(lium_client, pod1, test_files_content)
             log(f"Uploaded {len(expected)} files with SHA256 verification")
             
             # Pierre learns from Bob's data loss disaster and sets up backups
@@ -110,30 +149,16 @@ class TestBackupRestoreE2E:
             backup_log_id = op["backup_log_id"]
             log(f"Backup started: {backup_log_id}")
             
-            # Pierre obsessively checks backup status every few seconds
-            def check_backup():
-                logs = lium_client.backup_logs(pod1) or []
-                for lg in logs:
-                    if lg.id == backup_log_id:
-                        status = (lg.status or "").upper()
-                        if status in {"COMPLETED", "SUCCESS"}:
-                            return True, lg
-                        if status in {"FAILED", "ERROR"}:
-                            pytest.fail(f"Pierre's nightmare: Backup failed! {lg.error_message}")
-                        log(f"Backup status: {status}")
-                return False, None
-            
-            _wait_until(check_backup, "backup completion")
+            # Pierre obsessively checks backup status, less often the longer it takes
+            lg = lium_client.backup_wait(pod1, backup_log_id, timeout=remaining(POLL_MAX))
+            if lg is None:
+                pytest.fail("timeout waiting for backup completion")
+            if (lg.status or "").upper() in {"FAILED", "ERROR"}:
+                pytest.fail(f"Pierre's nightmare: Backup failed! {lg.error_message}")
             log("Backup completed - Pierre stops biting his nails")
             
-            # Pierre gets another premium GPU for restoration testing
-            exe2, gpu_type2 = _get_best_executor(lium_client, gpu_preference, "restore")
-            log(f"Pierre found another {gpu_type2} for restore: ${exe2.price_per_hour}/hour")
-            pod2 = lium_client.up(executor_id=exe2.id, pod_name=f"{test_pod_name}-dst", template_id=template_id)
-            created["pods"].append(pod2)
-            
-            # Pierre waits for the second pod while drinking champagne
-            pod2 = lium_client.wait_ready(pod2, timeout=1800)
+            # Pierre waits for the second pod (booting since before the backup) while drinking champagne
+            pod2 = lium_client.wait_ready(pod2, timeout=remaining(1800))
             assert pod2, "Pierre's restoration pod failed - time to become a baker"
             log(f"Pod {pod2.name} is ready for restore!")
             
@@ -144,18 +169,18 @@ class TestBackupRestoreE2E:
             
             # Pierre anxiously checks if his files are coming back
             def check_restored():
+                try:
+                    actual = _remote_sha256(lium_client, pod2, expected)
+                except Exception:
+                    return False, 0  # Pod not reachable yet
                 ok = 0
                 for path, expected_hash in expected.items():
-                    try:
-                        data = _read_file(lium_client, pod2, path)
-                        if _sha256(data) == expected_hash:
-                            ok += 1
-                            log(f"✓ {path} restored with correct SHA256")
-                    except Exception:
-                        pass  # File not ready yet
+                    if actual.get(path) == expected_hash:
+                        ok += 1
+                        log(f"✓ {path} restored with correct SHA256")
                 return (ok == len(expected)), ok
             
-            restored_count = _wait_until(check_restored, "files restored")
+            restored_count = _wait_until(check_restored, "files restored", max_s=remaining(POLL_MAX))
             assert restored_count == len(expected), f"Pierre devastated: Only {restored_count}/{len(expected)} files restored!"
             log("🎉 All files restored perfectly - Pierre celebrates with croissants!")
             
@@ -167,19 +192,8 @@ class TestBackupRestoreE2E:
                     lium_client.backup_delete(created["backup_config_id"])
                     log(f"Deleted backup config: {created['backup_config_id']}")
             except Exception as e:
-                print(f"Cleanup warning (backup): {e}")
-            
-            for pod in created["pods"]:
-                try:
-                    # We know it's a dict from up() return value
-                    pod_id = pod['id']
-                    pod_name = pod.get('name', pod_id)
-                    
-                    lium_client.down(pod_id)
-                    time.sleep(2)
-                    lium_client.rm(pod_id)
-                    log(f"Deleted pod: {pod_name}")
-                except Exception as e:
-                    print(f"Cleanup warning (pod): {e}")
+                _story.warning(f"Cleanup warning (backup): {e}")
             
             log("✅ Test completed - Pierre's data is safe!")
+            _story.removeHandler(story_out)
+            story_out.close()  # flushes whatever is still buffered
@@ -0,0 +1,32 @@
+"""Import smoke tests - every module must at least load, no API needed."""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import lium
+
+
+LIUM_MODULES = sorted(m.name for m in pkgutil.walk_packages(lium.__path__, prefix="lium."))
+
+
+@pytest.mark.unit
+def test_import_lium():
+    """The package exposes its public API."""
+    for name in lium.__all__:
+        assert hasattr(lium, name), f"lium.{name} is listed in __all__ but missing"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("module", LIUM_MODULES)
+def test_import_lium_module(module: str):
+    """Class bodies and annotations are evaluated at import time, so a bad one fails here."""
+    importlib.import_module(module)
+
+
+@pytest.mark.unit
+def test_import_lium_sdk():
+    """The standalone SDK module loads and exposes its clients."""
+    lium_sdk = importlib.import_module("lium_sdk")
+    assert lium_sdk.Lium and lium_sdk.AsyncLium
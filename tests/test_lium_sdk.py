@@ -0,0 +1,130 @@
+"""Offline unit tests for lium_sdk helpers that need no API or pod."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import lium_sdk
+from lium_sdk import Config, ExecResult, Lium, PodInfo
+
+
+def _pod(pod_id: str) -> PodInfo:
+    return PodInfo(
+        id=pod_id, name=pod_id, status="RUNNING", huid=pod_id, ssh_cmd=f"ssh root@{pod_id} -p 22",
+        ports={}, created_at="", updated_at="", executor=None, template={},
+        removal_scheduled_at=None, jupyter_installation_status=None, jupyter_url=None,
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for lium_sdk; advance it with `clock.now += seconds`."""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(lium_sdk, "time", SimpleNamespace(
+        monotonic=lambda: fake.now, perf_counter=time.perf_counter, sleep=time.sleep, time=time.time))
+    return fake
+
+
+@pytest.fixture
+def lium(monkeypatch):
+    """Offline client whose commands are answered by a stub instead of SSH."""
+    client = Lium(Config(api_key="test"))
+    client.ran = []
+
+    def run_command(pod, command, binary):
+        client.ran.append((pod.id, command, binary))
+        return {"stdout": f"run {len(client.ran)}", "stderr": "", "exit_code": 0, "success": True}
+
+    monkeypatch.setattr(client, "_run_command", run_command)
+    yield client
+    client.close()
+
+
+@pytest.mark.unit
+def test_exec_without_cache_ttl_always_runs(lium, clock):
+    pod = _pod("a")
+    lium.exec(pod, "nvidia-smi")
+    lium.exec(pod, "nvidia-smi")
+    assert len(lium.ran) == 2
+
+
+@pytest.mark.unit
+def test_exec_cache_hits_until_ttl_expires(lium, clock):
+    pod = _pod("a")
+    assert lium.exec(pod, "nvidia-smi", cache_ttl=5)["stdout"] == "run 1"
+    clock.now += 4.9
+    assert lium.exec(pod, "nvidia-smi", cache_ttl=5)["stdout"] == "run 1"
+    clock.now += 0.2
+    assert lium.exec(pod, "nvidia-smi", cache_ttl=5)["stdout"] == "run 2"
+
+
+@pytest.mark.unit
+def test_exec_cache_keys_on_pod_prepared_command_and_binary(lium, clock):
+    a, b = _pod("a"), _pod("b")
+    lium.exec(a, "env", env={"X": "1"}, cache_ttl=5)
+    lium.exec(a, 'export X="1" && env', cache_ttl=5)  # same prepared command: a hit
+    lium.exec(a, "env", env={"X": "2"}, cache_ttl=5)
+    lium.exec(b, "env", env={"X": "1"}, cache_ttl=5)
+    lium.exec(a, "env", env={"X": "1"}, binary=True, cache_ttl=5)
+    assert lium.ran == [
+        ("a", 'export X="1" && env', False),
+        ("a", 'export X="2" && env', False),
+        ("b", 'export X="1" && env', False),
+        ("a", 'export X="1" && env', True),
+    ]
+
+
+@pytest.mark.unit
+def test_exec_cache_returns_copies(lium, clock):
+    pod = _pod("a")
+    first = lium.exec(pod, "uptime", cache_ttl=5)
+    first["stdout"] = "mutated"
+    assert lium.exec(pod, "uptime", cache_ttl=5)["stdout"] == "run 1"
+
+
+@pytest.mark.unit
+def test_exec_cache_evicts_least_recently_used(lium, clock):
+    lium.EXEC_CACHE_SIZE = 2
+    pod = _pod("a")
+    lium.exec(pod, "one", cache_ttl=60)
+    lium.exec(pod, "two", cache_ttl=60)
+    lium.exec(pod, "one", cache_ttl=60)    # hit: "one" becomes most recent
+    lium.exec(pod, "three", cache_ttl=60)  # evicts "two"
+    lium.exec(pod, "one", cache_ttl=60)
+    lium.exec(pod, "two", cache_ttl=60)
+    assert [command for _, command, _ in lium.ran] == ["one", "two", "three", "two"]
+
+
+@pytest.mark.unit
+def test_exec_result_reads_like_the_old_dicts():
+    ok = ExecResult(pod="pod-a", success=True, stdout="hi\n", exit_code=0, duration_ms=1.5)
+
+    assert ok["stdout"] == "hi\n"
+    assert ok["exit_code"] == 0
+    assert ok.get("stdout") == "hi\n"
+    assert "stdout" in ok and "success" in ok
+
+
+@pytest.mark.unit
+def test_exec_result_unset_fields_are_missing_keys():
+    failed = ExecResult(pod="pod-a", success=False, error="Pod 'pod-a' not found")
+
+    # exit_code was never set, exactly like the error dicts that had no such key
+    assert "exit_code" not in failed
+    assert failed.get("exit_code") is None
+    assert failed.get("exit_code", -1) == -1
+    with pytest.raises(KeyError):
+        failed["exit_code"]
+    assert failed["error"] == "Pod 'pod-a' not found"
+    assert "error" not in ExecResult(pod="pod-a", success=True)
+
+
+@pytest.mark.unit
+def test_exec_result_unknown_keys():
+    result = ExecResult(pod="pod-a", success=True)
+
+    assert "nope" not in result
+    assert result.get("nope", "default") == "default"
+    with pytest.raises(KeyError):
+        result["nope"]
@@ -0,0 +1,115 @@
+"""Offline tests for the pods resource, driven through a scripted transport."""
+
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from lium.resources.pods import pods as pods_module
+from lium.resources.pods.async_pods import AsyncPods
+from lium.resources.pods.pods import Pods
+from lium.resources.pods.pods_core import _PodsCore
+from lium.transport.base import Transport
+
+POD_A, POD_B, OTHER = (uuid.uuid4() for _ in range(3))
+
+
+class ScriptedTransport(Transport):
+    """Answers each request with the next scripted JSON body and records what was asked."""
+
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.calls = []
+
+    def request(self, method, path, *, params=None, json=None, headers=None, **kwargs):
+        self.calls.append((method, path, params))
+        return httpx.Response(200, content=_dumps(self.bodies.pop(0)))
+
+    async def arequest(self, method, path, **kwargs):
+        return self.request(method, path, **kwargs)
+
+
+def _dumps(body) -> bytes:
+    return json.dumps(body, default=str).encode()
+
+
+def _rows(**statuses):
+    # Real /pods rows carry many more fields; only id and status are read while polling
+    pods = {"a": POD_A, "b": POD_B, "other": OTHER}
+    return [{"id": pods[name], "status": status, "pod_name": name} for name, status in statuses.items()]
+
+
+TICKS = [
+    _rows(a="PENDING", b="PENDING", other="RUNNING"),
+    _rows(a="RUNNING", b="PENDING", other="RUNNING"),
+    _rows(a="RUNNING", b="RUNNING", other="STOPPED"),
+]
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(pods_module.time, "sleep", lambda _: None)
+
+    async def _no_sleep(_):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+
+@pytest.mark.unit
+def test_wait_until_all_running_polls_pod_list_until_none_pending(no_sleep):
+    transport = ScriptedTransport(TICKS)
+    statuses = Pods(transport, None).wait_until_all_running([POD_A, str(POD_B)])
+
+    assert statuses == {POD_A: "RUNNING", POD_B: "RUNNING"}
+    # A leaves the pending set on the second tick, B on the third; then polling stops
+    assert transport.calls == [("GET", "/pods", None)] * 3
+    assert transport.bodies == []
+
+
+@pytest.mark.unit
+def test_wait_until_all_running_returns_last_statuses_on_timeout(no_sleep):
+    transport = ScriptedTransport(TICKS)
+    statuses = Pods(transport, None).wait_until_all_running([POD_A, POD_B], timeout=0)
+
+    assert statuses == {POD_A: "PENDING", POD_B: "PENDING"}
+    assert len(transport.calls) == 1
+
+
+@pytest.mark.unit
+def test_async_wait_until_all_running_polls_pod_list(no_sleep):
+    transport = ScriptedTransport(TICKS)
+    statuses = asyncio.run(AsyncPods(transport, None).wait_until_all_running([POD_A, POD_B]))
+
+    assert statuses == {POD_A: "RUNNING", POD_B: "RUNNING"}
+    assert transport.calls == [("GET", "/pods", None)] * 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query, expected", [
+    ("H200", (["H200"], None)),
+    ("1XA6000", (["A6000"], 1)),
+    ("8xH100", (["H100"], 8)),
+    (" 2 x H100 ", (["H100"], 2)),
+    ("H200,A6000,A100", (["H200", "A6000", "A100"], None)),
+    ("2xH100,A100", (["H100", "A100"], 2)),
+    ("2xH100,2xA100", (["H100", "A100"], 2)),
+    ("RTX 4090", (["RTX 4090"], None)),
+])
+def test_parse_machine_query(query, expected):
+    assert _PodsCore()._parse_machine_query(query) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", [
+    "2xH100,4xA100",  # different counts
+    "H100,2xA100",  # count only on a later machine
+    "H100,,A100",
+    "",
+    "H100;A100",
+])
+def test_parse_machine_query_rejects(query):
+    with pytest.raises(ValueError):
+        _PodsCore()._parse_machine_query(query)
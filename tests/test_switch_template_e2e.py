@@ -44,9 +44,9 @@ def _find_template(lium: Lium, identifier: str):
 
 def _wait_ready_with_template(lium: Lium, pod_id: str, expected_template_id: Optional[str], timeout: int = 900) -> Optional[PodInfo]:
     """Wait for pod to be ready, optionally with specific template."""
-    t0 = time.time()
+    t0 = time.monotonic()
     i = 0
-    while time.time() - t0 < timeout:
+    while time.monotonic() - t0 < timeout:
         p = next((p for p in lium.ps() if p.id == pod_id), None)
         if p and p.status.upper() == "RUNNING" and p.ssh_cmd:
             if expected_template_id is None or p.template.get("id") == expected_template_id:
@@ -120,7 +120,7 @@ def test_switch_template_e2e(lium_client: Lium, pod_lifecycle: PodInfo):
     pierre_says(f"Time to switch from croissants to baguettes with '{new_template.name}'!")
     
     # Step 3: Perform template switch
-    switch_start_time = time.time()
+    switch_start_time = time.monotonic()
     
     try:
         result = lium_client.switch_template(current_pod, new_template.id)
@@ -0,0 +1,115 @@
+"""Offline tests for the per-resource TTL cache, on a fake clock."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lium.models.executor import ExecutorFilterQuery
+from lium.utils import ttl_cache as ttl_cache_module
+from lium.utils.ttl_cache import clear_ttl_cache, invalidates_ttl_cache, ttl_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock; advance it with `clock.now += seconds`."""
+    fake = SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+    monkeypatch.setattr(ttl_cache_module, "time", fake)
+    return fake
+
+
+class Resource:
+    def __init__(self):
+        self.calls = []
+
+    @ttl_cache(seconds=10)
+    def lookup(self, filter_query=None):
+        self.calls.append(filter_query)
+        return [{"n": len(self.calls)}]
+
+    @ttl_cache(seconds=10, cache_if=lambda status: status == "DONE")
+    def status(self, sequence):
+        self.calls.append(sequence)
+        return sequence[len(self.calls) - 1]
+
+    @ttl_cache(seconds=10)
+    async def alookup(self):
+        self.calls.append(None)
+        return len(self.calls)
+
+    @invalidates_ttl_cache
+    def mutate(self):
+        pass
+
+
+@pytest.mark.unit
+def test_hit_until_ttl_expires(clock):
+    r = Resource()
+    assert r.lookup() == [{"n": 1}]
+    clock.now += 9.9
+    assert r.lookup() == [{"n": 1}]
+    clock.now += 0.2
+    assert r.lookup() == [{"n": 2}]
+    assert len(r.calls) == 2
+
+
+@pytest.mark.unit
+def test_different_args_get_separate_entries(clock):
+    r = Resource()
+    r.lookup({"machine_names": ["H100"]})
+    r.lookup({"machine_names": ["A100"]})
+    r.lookup({"machine_names": ["H100"]})
+    assert len(r.calls) == 2
+
+
+@pytest.mark.unit
+def test_dict_and_model_filters_are_hashable_and_share_a_key(clock):
+    r = Resource()
+    as_dict = {"machine_names": ["H100"], "gpu_count_gte": 2}
+    r.lookup(as_dict)
+    r.lookup(ExecutorFilterQuery.model_validate(as_dict))
+    r.lookup(ExecutorFilterQuery(machine_names=["H100"], gpu_count_gte=2))
+    assert len(r.calls) == 1
+
+
+@pytest.mark.unit
+def test_callers_get_copies(clock):
+    r = Resource()
+    first = r.lookup()
+    first.append("mutated")
+    first[0]["n"] = 99
+    assert r.lookup() == [{"n": 1}]
+
+
+@pytest.mark.unit
+def test_cache_if_skips_unfinished_results(clock):
+    r = Resource()
+    sequence = ("PENDING", "DONE", "never fetched")
+    assert r.status(sequence) == "PENDING"
+    assert r.status(sequence) == "DONE"  # PENDING was not kept
+    assert r.status(sequence) == "DONE"  # DONE was
+    assert len(r.calls) == 2
+
+
+@pytest.mark.unit
+def test_invalidates_ttl_cache_clears_entries(clock):
+    r = Resource()
+    r.lookup()
+    r.mutate()
+    r.lookup()
+    clear_ttl_cache(r)
+    r.lookup()
+    assert len(r.calls) == 3
+
+
+@pytest.mark.unit
+def test_async_methods_are_cached(clock):
+    r = Resource()
+
+    async def run():
+        return [await r.alookup(), await r.alookup()]
+
+    assert asyncio.run(run()) == [1, 1]
+    clock.now += 11
+    assert asyncio.run(r.alookup()) == 2